@@ -1,23 +1,63 @@
 import argparse
+import atexit
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
-import base64
+import fnmatch
 import logging
+import mmap
+import zlib
+import re
 import time
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 from pathlib import Path
 import sys
 import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 
-# Configure logging
-logging.basicConfig(
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-    level=logging.INFO,
-)
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library encoder
+    orjson = None
+
+try:
+    from pybase64 import b64encode
+except ImportError:  # pybase64 is optional; fall back to the standard library encoder
+    from base64 import b64encode
+
 logger = logging.getLogger("AcumaticaDeployment")
 
+# Separator line framing each deployment step in the log
+_SEP = "=" * 50
+
+# Read size for base64 encoding; a multiple of 3 so chunks encode without padding
+_CHUNK_SIZE = 57 * 1024
+
+# Suffix of the base64 cache file kept next to each package between retries
+_ENCODED_CACHE_SUFFIX = ".b64"
+
+# Compression level for gzip-encoded uploads; base64 text compresses well even at level 1
+_GZIP_LEVEL = 1
+
+# Connections kept per instance; also the upper bound for concurrent uploads
+_POOL_MAXSIZE = 16
+
+# Record of the packages last published to each instance, used to skip unchanged uploads
+_UPLOAD_CACHE_FILE = Path.home() / ".acumatica_deploy_cache.json"
+
+# Publish status polling: start fast, back off while nothing changes
+_POLL_INTERVAL_MIN = 2.0
+_POLL_INTERVAL_MAX = 30.0
+_POLL_BACKOFF_FACTOR = 1.5
+_MAX_STATUS_FAILURES = 3
+# Pre-encoded publishEnd body and (connect, read) timeout bounding a single status poll
+_EMPTY_JSON_BODY = b"{}"
+_STATUS_TIMEOUT = (3, 30)
+
 
 class DeploymentError(Exception):
     """Custom exception for deployment-related errors."""
@@ -33,6 +73,201 @@ class PackageConfig:
     project_description: str
 
 
+def dumps_json(data: Any) -> bytes:
+    """
+    Serialize data to a JSON request body, using orjson when available.
+    
+    Args:
+        data (Any): JSON-serializable data.
+        
+    Returns:
+        bytes: UTF-8 encoded JSON.
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+def encoded_cache_path(file_path: str) -> Path:
+    """
+    Get the path of the base64 cache file kept next to a package.
+    
+    Args:
+        file_path (str): Path to the package file.
+        
+    Returns:
+        Path: Path of the cache file.
+    """
+    return Path(file_path + _ENCODED_CACHE_SUFFIX)
+
+
+def build_encoded_cache(file_path: str) -> Path:
+    """
+    Base64-encode a package into its cache file unless one for this exact package exists.
+
+    The cache file takes the package's modification time, and is only reused
+    when that time and the expected encoded size both match the package.
+    
+    Args:
+        file_path (str): Path to the package file.
+        
+    Returns:
+        Path: Path of the cache file.
+    """
+    source_stat = os.stat(file_path)
+    cache_path = encoded_cache_path(file_path)
+    try:
+        cache_stat = cache_path.stat()
+        if (cache_stat.st_mtime_ns == source_stat.st_mtime_ns
+                and cache_stat.st_size == 4 * ((source_stat.st_size + 2) // 3)):
+            return cache_path
+    except FileNotFoundError:
+        pass
+
+    # Write to a temporary file first so an interrupted run never leaves a truncated cache
+    # and concurrent runs never write into each other's file
+    temp_fd, temp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name)
+    try:
+        with os.fdopen(temp_fd, "wb") as target, open(file_path, "rb") as source:
+            for chunk in iter(lambda: source.read(_CHUNK_SIZE), b""):
+                target.write(b64encode(chunk))
+        os.utime(temp_path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+        os.replace(temp_path, cache_path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+    return cache_path
+
+
+def remove_encoded_cache(file_path: str) -> None:
+    """
+    Remove the base64 cache file of a package, if any.
+    
+    Args:
+        file_path (str): Path to the package file.
+    """
+    try:
+        encoded_cache_path(file_path).unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning(f"Could not remove encoded cache for {file_path}: {e}")
+
+
+class ImportRequestBody:
+    """
+    Streamed JSON body for the customization Import endpoint.
+
+    The package content is encoded once into a cache file next to the package
+    and memory-mapped while the body is sent, so the encoded package never has
+    to be held in memory and retries do not encode it again. If the cache
+    cannot be written, the content is encoded chunk by chunk on the fly. The
+    body can be iterated more than once, which lets transport-level retries
+    resend it, and its exact length is known up front so no chunked encoding
+    is needed.
+    
+    Attributes:
+        file_path (str): Path to the package file.
+        cache_path (Optional[Path]): Path to the encoded cache file, if available.
+        prefix (bytes): JSON up to the opening quote of the package content.
+        suffix (bytes): JSON after the closing quote of the package content.
+    """
+
+    def __init__(self, file_path: str, project_data: Dict[str, Any]):
+        """
+        Initialize the request body.
+        
+        Args:
+            file_path (str): Path to the package file.
+            project_data (Dict[str, Any]): Project metadata without the content.
+        """
+        self.file_path = file_path
+        try:
+            self.cache_path = build_encoded_cache(file_path)
+        except OSError as e:
+            logger.warning(f"Could not cache encoded package {file_path}: {e}")
+            self.cache_path = None
+        self.prefix = dumps_json(project_data)[:-1] + b',"projectContentBase64":"'
+        self.suffix = b'"}'
+
+    def __len__(self) -> int:
+        encoded_size = 4 * ((os.path.getsize(self.file_path) + 2) // 3)
+        return len(self.prefix) + encoded_size + len(self.suffix)
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self.prefix
+        if self.cache_path is not None:
+            yield from self._iter_cached()
+        else:
+            with open(self.file_path, "rb") as file:
+                for chunk in iter(lambda: file.read(_CHUNK_SIZE), b""):
+                    yield b64encode(chunk)
+        yield self.suffix
+
+    def _iter_cached(self) -> Iterator[bytes]:
+        with open(self.cache_path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if not size:
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for offset in range(0, size, _CHUNK_SIZE):
+                    yield mapped[offset:offset + _CHUNK_SIZE]
+
+
+class GzipRequestBody:
+    """
+    Gzip-compressed stream of another request body.
+
+    Compression happens while the body is sent, at a low level to keep CPU
+    cost small. The length is not known in advance, so the body is sent with
+    chunked transfer encoding. Like the wrapped body, it can be iterated more
+    than once.
+    
+    Attributes:
+        body (Iterable[bytes]): Body to compress.
+    """
+
+    def __init__(self, body: Iterable[bytes]):
+        """
+        Initialize the compressed body.
+        
+        Args:
+            body (Iterable[bytes]): Body to compress.
+        """
+        self.body = body
+
+    def __iter__(self) -> Iterator[bytes]:
+        compressor = zlib.compressobj(_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        for chunk in self.body:
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+
+
+def upload_workers_type(value: str) -> int:
+    """
+    Validate the number of concurrent uploads given on the command line.
+    
+    Args:
+        value (str): Command line value.
+        
+    Returns:
+        int: Number of concurrent uploads.
+        
+    Raises:
+        argparse.ArgumentTypeError: If the value is not an integer between 1 and the pool size.
+    """
+    try:
+        workers = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if not 1 <= workers <= _POOL_MAXSIZE:
+        raise argparse.ArgumentTypeError(f"must be between 1 and {_POOL_MAXSIZE}, got {workers}")
+    return workers
+
+
 def parse_arguments() -> argparse.Namespace:
     """
     Parse command line arguments.
@@ -46,13 +281,80 @@ def parse_arguments() -> argparse.Namespace:
     parser.add_argument("--password", required=True, help="Password for authentication")
     parser.add_argument("--package-dir", required=True, help="Directory containing packages")
     parser.add_argument("--config-file", help="JSON configuration file for packages")
-    parser.add_argument("--wait-before-upload", type=int, default=3, 
+    parser.add_argument("--wait-before-upload", type=int, default=0, 
                         help="Wait time in seconds before upload")
-    parser.add_argument("--wait-before-publish", type=int, default=5, 
+    parser.add_argument("--wait-before-publish", type=int, default=0, 
                         help="Wait time in seconds before publishing")
+    parser.add_argument("--upload-workers", type=upload_workers_type, default=8,
+                        help=f"Number of packages to upload concurrently (1-{_POOL_MAXSIZE})")
+    parser.add_argument("--no-upload-cache", dest="use_upload_cache", action="store_false",
+                        help="Upload every package even if it is unchanged since the last deployment")
+    parser.add_argument("--compress-uploads", action="store_true",
+                        help="Gzip upload bodies (the server must accept Content-Encoding: gzip)")
     return parser.parse_args()
 
 
+class _AdapterPool:
+    """
+    Process-wide HTTP connection pools keyed by instance URL and username.
+
+    Repeated deployments to the same instance in one process reuse the open
+    connections instead of paying for new TLS handshakes. Only the adapter is
+    shared; each client keeps its own session, so headers and authentication
+    cookies are never shared between deployments. All adapters are closed at
+    interpreter exit.
+    """
+    _pool: Dict[Tuple[str, str], HTTPAdapter] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls, key: Tuple[str, str]) -> HTTPAdapter:
+        """
+        Get the adapter for a key, creating it on first use.
+        
+        Args:
+            key (Tuple[str, str]): Instance URL and username.
+            
+        Returns:
+            HTTPAdapter: Shared HTTP adapter.
+        """
+        with cls._lock:
+            adapter = cls._pool.get(key)
+            if adapter is None:
+                adapter = cls._pool[key] = cls._create_adapter()
+            return adapter
+
+    @classmethod
+    def close_all(cls) -> None:
+        """
+        Close and forget all pooled adapters.
+        """
+        with cls._lock:
+            for adapter in cls._pool.values():
+                adapter.close()
+            cls._pool.clear()
+
+    @staticmethod
+    def _create_adapter() -> HTTPAdapter:
+        # Size the pool for concurrent uploads and retry transient gateway errors.
+        # Read errors are not retried: the request may already have been processed,
+        # and a stalled server would otherwise multiply the read timeout.
+        return HTTPAdapter(
+            pool_connections=_POOL_MAXSIZE,
+            pool_maxsize=_POOL_MAXSIZE,
+            max_retries=Retry(
+                total=5,
+                read=0,
+                backoff_factor=0.5,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=frozenset(["POST", "GET"]),
+            ),
+        )
+
+
+atexit.register(_AdapterPool.close_all)
+
+
 class AcumaticaDeploymentClient:
     """
     Client for handling Acumatica deployments.
@@ -60,12 +362,14 @@ class AcumaticaDeploymentClient:
     Attributes:
         base_url (str): Base URL for Acumatica API endpoints.
         customization_url (str): URL for customization API.
-        session (requests.Session): HTTP session for requests.
+        session (requests.Session): HTTP session for requests, using connections shared per instance and user.
         username (str): Username for authentication.
         password (str): Password for authentication.
+        compress_uploads (bool): Whether to gzip upload bodies.
     """
     
-    def __init__(self, instance_url: str, username: str, password: str):
+    def __init__(self, instance_url: str, username: str, password: str,
+                 compress_uploads: bool = False):
         """
         Initialize the Acumatica deployment client.
         
@@ -73,6 +377,7 @@ class AcumaticaDeploymentClient:
             instance_url (str): Acumatica instance URL.
             username (str): Username for authentication.
             password (str): Password for authentication.
+            compress_uploads (bool): Whether to gzip upload bodies.
         """
         self.base_url = f"{instance_url}/entity/"
         self.customization_url = f"{instance_url}/CustomizationApi"
@@ -80,8 +385,15 @@ class AcumaticaDeploymentClient:
         self.session.headers.update(
             {"Accept": "application/json", "Content-Type": "application/json"}
         )
+        adapter = _AdapterPool.get((instance_url.rstrip("/"), username))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # The polling loop retries status checks itself, so they bypass adapter retries
+        self.session.mount(f"{self.customization_url}/publishEnd", HTTPAdapter(max_retries=0))
         self.username = username
         self.password = password
+        self.compress_uploads = compress_uploads
+        self._authenticated = False
 
     def login(self) -> None:
         """
@@ -91,34 +403,34 @@ class AcumaticaDeploymentClient:
             DeploymentError: If authentication fails.
         """
         try:
-            logger.info("=" * 50)
+            logger.info(_SEP)
             logger.info("Authenticating with Acumatica...")
             response = self.session.post(
                 f"{self.base_url}auth/login",
                 json={"name": self.username, "password": self.password},
             )
             response.raise_for_status()
+            self._authenticated = True
             logger.info("Authentication successful")
-            logger.info("=" * 50)
+            logger.info(_SEP)
         except requests.exceptions.RequestException as e:
             logger.error(f"Authentication failed: {str(e)}")
             raise DeploymentError(f"Authentication failed: {str(e)}")
 
     def logout(self) -> None:
         """
-        Log out from Acumatica and close the session.
+        Log out from Acumatica, keeping the shared connections open for reuse.
         """
+        self._authenticated = False
         try:
-            logger.info("=" * 50)
+            logger.info(_SEP)
             logger.info("Logging out...")
             response = self.session.post(f"{self.base_url}auth/logout")
             response.raise_for_status()
             logger.info("Logout successful")
-            logger.info("=" * 50)
+            logger.info(_SEP)
         except requests.exceptions.RequestException as e:
             logger.warning(f"Logout encountered an issue: {str(e)}")
-        finally:
-            self.session.close()
 
     def upload_file(self, file_path: str, project_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -132,18 +444,20 @@ class AcumaticaDeploymentClient:
             Dict[str, Any]: Result of the upload operation.
         """
         try:
-            logger.info("=" * 50)
+            logger.info(_SEP)
             logger.info(f"Uploading package: {project_data['projectName']}")
-            with open(file_path, "rb") as file:
-                encoded_content = base64.b64encode(file.read()).decode("utf-8")
-            project_data["projectContentBase64"] = encoded_content
+            body = ImportRequestBody(file_path, project_data)
+            headers = {}
+            if self.compress_uploads:
+                body = GzipRequestBody(body)
+                headers["Content-Encoding"] = "gzip"
 
             url = f"{self.customization_url}/Import"
-            response = self.session.post(url=url, json=project_data)
+            response = self.session.post(url=url, data=body, headers=headers)
             response.raise_for_status()
 
             logger.info(f"Upload successful for package: {project_data['projectName']}")
-            logger.info("=" * 50)
+            logger.info(_SEP)
             return {"success": True, "project_name": project_data["projectName"]}
         except Exception as e:
             logger.error(f"Error uploading {file_path}: {e}")
@@ -180,13 +494,13 @@ class AcumaticaDeploymentClient:
             "tenantMode": "Current",
         }
         try:
-            logger.info("=" * 50)
+            logger.info(_SEP)
             logger.info("Starting publication process...")
             url = f"{self.customization_url}/publishBegin"
-            response = self.session.post(url=url, data=json.dumps(publish_data))
+            response = self.session.post(url=url, data=dumps_json(publish_data))
             response.raise_for_status()
             logger.info("Publishing started successfully")
-            logger.info("=" * 50)
+            logger.info(_SEP)
             return {"success": True}
         except Exception as e:
             logger.error(f"Failed to start publishing: {str(e)}")
@@ -201,7 +515,7 @@ class AcumaticaDeploymentClient:
         """
         try:
             url = f"{self.customization_url}/publishEnd"
-            response = self.session.post(url=url, json={})
+            response = self.session.post(url=url, data=_EMPTY_JSON_BODY, timeout=_STATUS_TIMEOUT)
             response.raise_for_status()
 
             status_data = response.json()
@@ -221,6 +535,51 @@ class AcumaticaDeploymentClient:
             }
 
 
+# Default package configuration, used when no configuration file is provided
+_DEFAULT_PACKAGE_CONFIG = (
+    {
+        "file_pattern": "RW.Base.*.zip",
+        "project_level": 1,
+        "project_description": "This Package contains all screens but the GST related screens & dll"
+    },
+    {
+        "file_pattern": "RW.Screens.Extension.Files.*.zip",
+        "project_level": 2,
+        "project_description": "Contains customized screens of Acumatica"
+    },
+    {
+        "file_pattern": "RW.SiteMap.*.zip",
+        "project_level": 3,
+        "project_description": "Readywire Product Navigation"
+    },
+    {
+        "file_pattern": "RW.Branding.*.zip",
+        "project_level": 4,
+        "project_description": "Readywire Branding Info"
+    },
+    {
+        "file_pattern": "RW.Endpoints.*.zip",
+        "project_level": 5,
+        "project_description": "APIs package"
+    },
+    {
+        "file_pattern": "RW.Security.*.zip",
+        "project_level": 6,
+        "project_description": "Roles & their access on screens"
+    },
+    {
+        "file_pattern": "RW.BusinessEvents.*.zip",
+        "project_level": 7,
+        "project_description": "Business Events and corresponding Notification Templates"
+    },
+    {
+        "file_pattern": "RW.FinancialReports.*.zip",
+        "project_level": 8,
+        "project_description": "Readywire financial reports"
+    },
+)
+
+
 def load_package_config(config_file: Optional[str] = None) -> List[Dict[str, Any]]:
     """
     Load package configuration from a JSON file or return default configuration.
@@ -236,48 +595,7 @@ def load_package_config(config_file: Optional[str] = None) -> List[Dict[str, Any
             return json.load(f)
     
     # Default configuration if no file provided
-    return [
-        {
-            "file_pattern": "RW.Base.*.zip",
-            "project_level": 1,
-            "project_description": "This Package contains all screens but the GST related screens & dll"
-        },
-        {
-            "file_pattern": "RW.Screens.Extension.Files.*.zip",
-            "project_level": 2,
-            "project_description": "Contains customized screens of Acumatica"
-        },
-        {
-            "file_pattern": "RW.SiteMap.*.zip",
-            "project_level": 3,
-            "project_description": "Readywire Product Navigation"
-        },
-        {
-            "file_pattern": "RW.Branding.*.zip",
-            "project_level": 4,
-            "project_description": "Readywire Branding Info"
-        },
-        {
-            "file_pattern": "RW.Endpoints.*.zip",
-            "project_level": 5,
-            "project_description": "APIs package"
-        },
-        {
-            "file_pattern": "RW.Security.*.zip",
-            "project_level": 6,
-            "project_description": "Roles & their access on screens"
-        },
-        {
-            "file_pattern": "RW.BusinessEvents.*.zip",
-            "project_level": 7,
-            "project_description": "Business Events and corresponding Notification Templates"
-        },
-        {
-            "file_pattern": "RW.FinancialReports.*.zip",
-            "project_level": 8,
-            "project_description": "Readywire financial reports"
-        },
-    ]
+    return [dict(package_config) for package_config in _DEFAULT_PACKAGE_CONFIG]
 
 
 def find_package_files(base_directory: Path, config: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -294,18 +612,26 @@ def find_package_files(base_directory: Path, config: List[Dict[str, Any]]) -> Li
     if not base_directory.exists():
         raise FileNotFoundError(f"Directory not found: {base_directory}")
 
+    # List the directory once and match every pattern against that listing
+    entries = list(base_directory.iterdir())
+    entry_names = [os.path.normcase(entry.name) for entry in entries]
+
     result = []
     for package_config in config:
         file_pattern = package_config["file_pattern"]
-        matching_files = list(base_directory.glob(file_pattern))
+        pattern = re.compile(fnmatch.translate(os.path.normcase(file_pattern)))
+        # Use the first matching file
+        file_path = next(
+            (entry for entry, name in zip(entries, entry_names) if pattern.match(name)),
+            None,
+        )
         
-        if not matching_files:
+        if file_path is None:
             logger.warning(f"No files found matching pattern: {file_pattern}")
             continue
             
-        # Use the first matching file
-        file_path = matching_files[0]
         project_name = file_path.stem
+        file_stat = file_path.stat()
         
         project_data = {
             "projectLevel": package_config["project_level"],
@@ -316,7 +642,8 @@ def find_package_files(base_directory: Path, config: List[Dict[str, Any]]) -> Li
         
         result.append({
             "file_path": str(file_path),
-            "project_data": project_data
+            "project_data": project_data,
+            "cache_key": [file_stat.st_size, int(file_stat.st_mtime)]
         })
     
     if not result:
@@ -325,9 +652,63 @@ def find_package_files(base_directory: Path, config: List[Dict[str, Any]]) -> Li
     return result
 
 
+def load_upload_cache() -> Dict[str, Dict[str, List[int]]]:
+    """
+    Load the record of packages last published to each instance.
+    
+    Returns:
+        Dict[str, Dict[str, List[int]]]: Cache keys by instance URL and project name.
+    """
+    try:
+        with open(_UPLOAD_CACHE_FILE, 'r') as f:
+            cache = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable upload cache {_UPLOAD_CACHE_FILE}: {e}")
+        return {}
+
+    if not isinstance(cache, dict):
+        logger.warning(f"Ignoring malformed upload cache {_UPLOAD_CACHE_FILE}")
+        return {}
+    return {
+        instance_url: projects
+        for instance_url, projects in cache.items()
+        if isinstance(projects, dict)
+    }
+
+
+def save_upload_cache(cache: Dict[str, Dict[str, List[int]]]) -> None:
+    """
+    Save the record of packages last published to each instance.
+    
+    Args:
+        cache (Dict[str, Dict[str, List[int]]]): Cache keys by instance URL and project name.
+    """
+    # Write to a temporary file first so concurrent runs never read a half-written cache
+    try:
+        temp_fd, temp_path = tempfile.mkstemp(
+            dir=_UPLOAD_CACHE_FILE.parent, prefix=_UPLOAD_CACHE_FILE.name
+        )
+    except OSError as e:
+        logger.warning(f"Could not save upload cache {_UPLOAD_CACHE_FILE}: {e}")
+        return
+    try:
+        with os.fdopen(temp_fd, 'w') as f:
+            json.dump(cache, f, indent=2)
+        os.replace(temp_path, _UPLOAD_CACHE_FILE)
+    except OSError as e:
+        logger.warning(f"Could not save upload cache {_UPLOAD_CACHE_FILE}: {e}")
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+
+
 def deploy_packages(instance_url: str, username: str, password: str, package_dir: str, 
-                    config_file: Optional[str] = None, wait_before_upload: int = 3, 
-                    wait_before_publish: int = 5) -> bool:
+                    config_file: Optional[str] = None, wait_before_upload: int = 0, 
+                    wait_before_publish: int = 0, upload_workers: int = 8,
+                    use_upload_cache: bool = True, compress_uploads: bool = False) -> bool:
     """
     Deploy packages to Acumatica.
     
@@ -339,94 +720,149 @@ def deploy_packages(instance_url: str, username: str, password: str, package_dir
         config_file (Optional[str]): Package configuration file.
         wait_before_upload (int): Wait time in seconds before upload.
         wait_before_publish (int): Wait time in seconds before publishing.
+        upload_workers (int): Number of packages to upload concurrently, at most the pool size.
+        use_upload_cache (bool): Whether to skip packages unchanged since the last deployment.
+        compress_uploads (bool): Whether to gzip upload bodies.
         
     Returns:
         bool: True if deployment was successful, False otherwise.
+        
+    Raises:
+        ValueError: If upload_workers is not between 1 and the connection pool size.
     """
+    if not 1 <= upload_workers <= _POOL_MAXSIZE:
+        raise ValueError(f"upload_workers must be between 1 and {_POOL_MAXSIZE}, got {upload_workers}")
+
     base_directory = Path(package_dir)
-    client = AcumaticaDeploymentClient(instance_url, username, password)
+    client = AcumaticaDeploymentClient(instance_url, username, password, compress_uploads)
     
     # Load configuration and find files
     package_config = load_package_config(config_file)
     files_config = find_package_files(base_directory, package_config)
     project_names = [config["project_data"]["projectName"] for config in files_config]
+
+    # Skip packages whose size and modification time match the last deployment
+    upload_cache = load_upload_cache()
+    instance_cache = upload_cache.setdefault(instance_url.rstrip("/"), {})
+    to_upload = []
+    for config in files_config:
+        project_name = config["project_data"]["projectName"]
+        if use_upload_cache and instance_cache.get(project_name) == config["cache_key"]:
+            logger.info(f"Skipping unchanged package: {project_name}")
+        else:
+            to_upload.append(config)
     
     try:
         # Step 1: Login to Acumatica
         client.login()
 
         # Wait before upload
-        logger.info("=" * 50)
-        logger.info(f"Waiting {wait_before_upload} seconds before starting upload...")
-        time.sleep(wait_before_upload)
+        if wait_before_upload > 0:
+            logger.info(_SEP)
+            logger.info(f"Waiting {wait_before_upload} seconds before starting upload...")
+            time.sleep(wait_before_upload)
 
         # Step 2: Upload files
-        logger.info("=" * 50)
+        logger.info(_SEP)
         logger.info("Starting package uploads...")
         upload_results = []
-        for config in files_config:
-            result = client.upload_file(config["file_path"], config["project_data"])
-            upload_results.append(result)
-            if not result["success"]:
-                raise DeploymentError(f"Upload failed for {result['project_name']}")
-        logger.info("=" * 50)
+        with ThreadPoolExecutor(max_workers=upload_workers) as executor:
+            futures = {
+                executor.submit(client.upload_file, config["file_path"], config["project_data"]): config
+                for config in to_upload
+            }
+            for future in as_completed(futures):
+                result = future.result()
+                upload_results.append(result)
+                if not result["success"]:
+                    # Stop any uploads that have not started yet
+                    for pending in futures:
+                        pending.cancel()
+                    raise DeploymentError(f"Upload failed for {result['project_name']}")
+        logger.info(_SEP)
 
         # Wait before publishing
-        logger.info("=" * 50)
-        logger.info(f"Waiting {wait_before_publish} seconds before publishing...")
-        time.sleep(wait_before_publish)
+        if wait_before_publish > 0:
+            logger.info(_SEP)
+            logger.info(f"Waiting {wait_before_publish} seconds before publishing...")
+            time.sleep(wait_before_publish)
 
         # Step 3: Publish Customization Project
-        logger.info("=" * 50)
+        logger.info(_SEP)
         logger.info("Starting publication process...")
         publish_result = client.publish_customizations(project_names)
         if not publish_result["success"]:
             raise DeploymentError("Failed to start publishing")
-        logger.info("=" * 50)
+        logger.info(_SEP)
 
         # Step 4: Monitor publish status
-        logger.info("=" * 50)
+        logger.info(_SEP)
         logger.info("Monitoring publication status...")
-        seen_logs = set()
+        # The server returns the full log history on every poll, in order
+        seen_count = 0
+        interval = _POLL_INTERVAL_MIN
+        status_failures = 0
         while True:
             status = client.check_publish_status()
 
             if not status["success"]:
-                raise DeploymentError(
-                    f"Error checking publish status: {status.get('error')}"
-                )
+                status_failures += 1
+                if status_failures >= _MAX_STATUS_FAILURES:
+                    raise DeploymentError(
+                        f"Error checking publish status: {status.get('error')}"
+                    )
+                # Transient failure; retry soon
+                interval = _POLL_INTERVAL_MIN
+                time.sleep(interval)
+                continue
+            status_failures = 0
 
             # Log any new messages
-            for log_entry in status.get("logs", []):
-                log_type = log_entry.get("logType", "").upper()
-                message = log_entry.get("message", "")
-                log_identifier = f"{log_type}:{message}"
-
-                if log_identifier not in seen_logs:
+            logs = status.get("logs", [])
+            new_logs = logs[seen_count:]
+            if logger.isEnabledFor(logging.INFO):
+                for log_entry in new_logs:
+                    log_type = log_entry.get("logType", "").upper()
+                    message = log_entry.get("message", "")
                     logger.info(f"[{log_type}] {message}")
-                    seen_logs.add(log_identifier)
+            seen_count = len(logs)
+            has_new_logs = bool(new_logs)
 
             # Check if process is complete
             if status["is_complete"]:
                 if status["is_failed"]:
                     raise DeploymentError("Publishing completed with errors")
                 logger.info("Publishing completed successfully!")
-                logger.info("=" * 50)
+                logger.info(_SEP)
                 break
 
-            time.sleep(5)  # Check status every 5 seconds
+            # Poll faster while progress is reported, back off while idle
+            if has_new_logs:
+                interval = _POLL_INTERVAL_MIN
+            else:
+                interval = min(interval * _POLL_BACKOFF_FACTOR, _POLL_INTERVAL_MAX)
+            time.sleep(interval)
 
-        logger.info("=" * 50)
+        # Remember what was published so the next run can skip unchanged packages
+        for config in files_config:
+            instance_cache[config["project_data"]["projectName"]] = config["cache_key"]
+        save_upload_cache(upload_cache)
+
+        logger.info(_SEP)
         logger.info("Deployment completed successfully!")
-        logger.info("=" * 50)
+        logger.info(_SEP)
+
+        # Encoded caches are only worth keeping for re-runs of a failed deployment
+        for config in files_config:
+            remove_encoded_cache(config["file_path"])
         return True
 
     except Exception as e:
         logger.error(f"Deployment failed: {str(e)}")
         return False
     finally:
-        # Always attempt to logout if session exists
-        if hasattr(client, 'session') and client.session.cookies:
+        # Always logout if login succeeded
+        if client._authenticated:
             client.logout()
 
 def main():
@@ -442,7 +878,10 @@ def main():
             package_dir=args.package_dir,
             config_file=args.config_file,
             wait_before_upload=args.wait_before_upload,
-            wait_before_publish=args.wait_before_publish
+            wait_before_publish=args.wait_before_publish,
+            upload_workers=args.upload_workers,
+            use_upload_cache=args.use_upload_cache,
+            compress_uploads=args.compress_uploads
         )
         if not success:
             sys.exit(1)
@@ -452,4 +891,10 @@ def main():
 
 
 if __name__ == "__main__":
+    # Configure logging only when run as a script, not when imported
+    logging.basicConfig(
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+        level=logging.INFO,
+    )
     main()
\ No newline at end of file